@@ -96,6 +96,21 @@ class Settings(BaseSettings):
         "google/gemini-2.0-flash-001", validation_alias="VISION_MODEL"
     )
 
+    # --- Moderation 설정 ---
+    # 이 길이 미만의 의심 문자 없는 댓글은 LLM 판정 없이 SAFE 처리
+    moderation_min_length: int = Field(8, validation_alias="MODERATION_MIN_LENGTH")
+    # Pydantic Settings tries to parse List[str] as JSON. read as str to avoid error.
+    moderation_blocklist_raw: str = Field("", validation_alias="MODERATION_BLOCKLIST")
+
+    @property
+    def moderation_blocklist(self) -> List[str]:
+        """프리필터가 즉시 BLOCK 처리할 용어 목록 (쉼표 구분)."""
+        if not self.moderation_blocklist_raw:
+            return []
+        return [
+            t.strip() for t in self.moderation_blocklist_raw.split(",") if t.strip()
+        ]
+
     # --- Coach LLM 설정 ---
     coach_llm_provider: str = Field("openrouter", validation_alias="COACH_LLM_PROVIDER")
     coach_max_output_tokens: int = Field(
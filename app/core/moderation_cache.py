@@ -0,0 +1,160 @@
+"""모더레이션 판정 결과를 재사용하기 위한 2단계 인메모리 캐시 모듈입니다.
+
+KBO 커뮤니티 콘텐츠는 동일한 구호/스팸/비속어가 반복적으로 게시되는 특성이 있어,
+`/moderation/safety-check`가 같은 내용을 Gemini에 반복 질의하게 됩니다.
+이 모듈은 두 개의 티어로 캐시 적중 시 LLM 호출 자체를 생략합니다:
+
+    1. 정확 일치 티어: 정규화된 본문의 SHA256 해시 → 판정 결과 (TTL 적용)
+    2. 의미 기반 티어: 최근 판정들의 임베딩과 코사인 유사도를 비교하여
+       임계값(기본 0.95) 이상이면 기존 판정을 재사용
+
+판정이 ALLOW인 경우는 긴 TTL(기본 24시간), BLOCK인 경우는 정책 재평가를
+위해 짧은 TTL(기본 1시간)을 적용합니다.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import time
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_EXACT_CACHE_MAX = int(os.getenv("MODERATION_CACHE_MAX", "4096"))
+_SAFE_TTL_SECONDS = float(os.getenv("MODERATION_CACHE_SAFE_TTL", str(24 * 3600)))
+_BLOCK_TTL_SECONDS = float(os.getenv("MODERATION_CACHE_BLOCK_TTL", str(3600)))
+_SEMANTIC_WINDOW = int(os.getenv("MODERATION_CACHE_SEMANTIC_WINDOW", "512"))
+_SEMANTIC_THRESHOLD = float(os.getenv("MODERATION_CACHE_SEMANTIC_THRESHOLD", "0.95"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_content(content: str) -> str:
+    """공백을 정규화하고 대소문자를 통일하여 캐시 키의 변동성을 줄입니다."""
+    if not content:
+        return ""
+    return _WHITESPACE_RE.sub(" ", content).strip().casefold()
+
+
+def _content_key(content: str) -> str:
+    """정규화된 본문의 SHA256 해시를 정확 일치 티어의 키로 사용합니다."""
+    return hashlib.sha256(_normalize_content(content).encode("utf-8")).hexdigest()
+
+
+def _unit_vector(embedding: List[float]) -> Optional[np.ndarray]:
+    """임베딩을 float32 단위 벡터로 변환합니다. 노름이 0이면 None."""
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    if norm == 0.0:
+        return None
+    return vec / norm
+
+
+class ModerationVerdictCache:
+    """정확 일치 + 의미 기반 2단계로 모더레이션 판정을 캐시하는 클래스입니다.
+
+    정확 일치 티어는 LRU(OrderedDict)로, 의미 기반 티어는 최근 판정의
+    롤링 윈도우(deque)로 관리합니다. 모든 접근은 asyncio.Lock으로 직렬화됩니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _EXACT_CACHE_MAX,
+        safe_ttl: float = _SAFE_TTL_SECONDS,
+        block_ttl: float = _BLOCK_TTL_SECONDS,
+        semantic_window: int = _SEMANTIC_WINDOW,
+        semantic_threshold: float = _SEMANTIC_THRESHOLD,
+    ) -> None:
+        self.max_entries = max_entries
+        self.safe_ttl = safe_ttl
+        self.block_ttl = block_ttl
+        self.semantic_threshold = semantic_threshold
+        # (만료 시각, 판정) - 키는 정규화된 본문의 SHA256
+        self._exact: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        # (정규화된 float32 임베딩, 만료 시각, 판정)
+        self._semantic: Deque[Tuple[np.ndarray, float, Dict]] = deque(
+            maxlen=semantic_window
+        )
+        self._lock = asyncio.Lock()
+
+    def _ttl_for(self, verdict: Dict) -> float:
+        """판정 결과에 따라 TTL을 결정합니다. BLOCK은 정책 변경에 대비해 짧게 유지합니다."""
+        if verdict.get("action") == "BLOCK":
+            return self.block_ttl
+        return self.safe_ttl
+
+    async def get_exact(self, content: str) -> Optional[Dict]:
+        """정확 일치 티어에서 판정을 조회합니다. 만료된 항목은 제거합니다."""
+        key = _content_key(content)
+        now = time.time()
+        async with self._lock:
+            entry = self._exact.get(key)
+            if entry is None:
+                return None
+            expires_at, verdict = entry
+            if expires_at <= now:
+                self._exact.pop(key, None)
+                return None
+            self._exact.move_to_end(key)
+            return dict(verdict)
+
+    async def get_semantic(self, embedding: List[float]) -> Optional[Dict]:
+        """의미 기반 티어에서 가장 유사한 최근 판정을 조회합니다.
+
+        코사인 유사도가 임계값 이상인 top-1 항목의 판정을 재사용합니다.
+        저장 시 정규화해 둔 벡터들을 행렬로 쌓아 단일 행렬-벡터 곱으로
+        전체 윈도우의 유사도를 한 번에 계산합니다. (순수 파이썬 내적 루프는
+        윈도우 512 × 1536차원 기준 수십 ms로, 락을 쥔 채 이벤트 루프를 막음)
+        """
+        if not embedding:
+            return None
+        query = _unit_vector(embedding)
+        if query is None:
+            return None
+        now = time.time()
+        async with self._lock:
+            live = [
+                (vec, verdict)
+                for vec, expires_at, verdict in self._semantic
+                if expires_at > now and vec.shape == query.shape
+            ]
+            if not live:
+                return None
+            scores = np.stack([vec for vec, _ in live]) @ query
+            best_idx = int(np.argmax(scores))
+            if float(scores[best_idx]) >= self.semantic_threshold:
+                return dict(live[best_idx][1])
+        return None
+
+    async def set(
+        self,
+        content: str,
+        verdict: Dict,
+        embedding: Optional[List[float]] = None,
+    ) -> None:
+        """판정 결과를 두 티어에 저장합니다. 임베딩이 없으면 정확 일치 티어만 갱신합니다."""
+        key = _content_key(content)
+        expires_at = time.time() + self._ttl_for(verdict)
+        stored = dict(verdict)
+        async with self._lock:
+            self._exact[key] = (expires_at, stored)
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.max_entries:
+                self._exact.popitem(last=False)
+            if embedding:
+                vec = _unit_vector(embedding)
+                if vec is not None:
+                    self._semantic.append((vec, expires_at, stored))
+
+    async def clear(self) -> None:
+        """두 티어를 모두 비웁니다. (테스트 및 정책 변경 시 사용)"""
+        async with self._lock:
+            self._exact.clear()
+            self._semantic.clear()
+
+
+# 모듈 전역 싱글턴 - 엔드포인트에서 공유
+moderation_cache = ModerationVerdictCache()
@@ -0,0 +1,66 @@
+"""Gemini 호출 전에 명백한 케이스를 걸러내는 정규식 프리필터.
+
+KBO 커뮤니티 댓글 대부분은 어떤 차단 용어도 포함하지 않는 평범한 글이라
+전부 LLM으로 보내는 것은 낭비입니다. 본문을 멀티패턴 alternation 정규식
+한 번의 스캔으로 검사하여:
+
+- 차단 목록(MODERATION_BLOCKLIST 설정) 용어가 있으면 BLOCK
+- 스팸/도박/스포일러 의심 패턴이 있으면 UNKNOWN (LLM 판정으로 진행)
+- 아무 패턴에도 걸리지 않으면 SAFE
+
+를 반환합니다. 외부 DFA 엔진(hyperscan 등) 대신 표준 re 모듈의 컴파일된
+alternation을 사용합니다 - 추가 의존성 없이 댓글 길이에 선형인 스캔으로
+흔한 케이스를 300ms LLM RTT에서 마이크로초 단위로 옮깁니다.
+"""
+
+import re
+from functools import lru_cache
+from typing import Literal, Optional, Tuple
+
+from ..config import Settings, get_settings
+
+# LLM 판정이 필요한 의심 신호 - URL/연락 유도(스팸), 도박 광고, 스포일러 단서
+_SUSPECT_TERMS = (
+    "http://",
+    "https://",
+    "www.",
+    ".com",
+    ".kr",
+    "카톡",
+    "텔레그램",
+    "오픈채팅",
+    "토토",
+    "먹튀",
+    "배팅",
+    "무료 픽",
+    "스포",
+    "결과 유출",
+)
+
+_SUSPECT_RE = re.compile(
+    "|".join(re.escape(term) for term in _SUSPECT_TERMS), re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=4)
+def _compile_blocklist(terms: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """설정의 차단 용어를 단일 alternation 패턴으로 컴파일해 캐시합니다."""
+    if not terms:
+        return None
+    return re.compile("|".join(re.escape(term) for term in terms), re.IGNORECASE)
+
+
+def prefilter(
+    content: str, settings: Optional[Settings] = None
+) -> Literal["SAFE", "UNKNOWN", "BLOCK"]:
+    """본문을 정규식으로 선분류합니다. LLM 호출 없이 결정 가능한 경우를 가립니다."""
+    settings = settings or get_settings()
+
+    block_re = _compile_blocklist(tuple(settings.moderation_blocklist))
+    if block_re is not None and block_re.search(content):
+        return "BLOCK"
+
+    if _SUSPECT_RE.search(content):
+        return "UNKNOWN"
+
+    return "SAFE"
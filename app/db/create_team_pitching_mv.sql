@@ -0,0 +1,29 @@
+-- mv_team_pitching_season 머티리얼라이즈드 뷰 생성
+-- 팀/시즌 단위 투구 집계를 미리 계산하여 verify 스크립트와 API가 공유하는 뷰
+-- player_season_pitching은 시즌 단위로만 갱신되므로, 매 조회마다 선수 단위
+-- 집계를 반복하는 대신 O(팀 수) 행 조회로 대체한다.
+
+-- 선발 요건 술어는 is_starter_role 생성 컬럼에 미리 계산되어 있음
+-- (scripts/add_starter_role_column.py)
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_team_pitching_season AS
+SELECT
+    season,
+    team_code,
+    SUM(CASE WHEN is_starter_role THEN innings_pitched ELSE 0 END) AS starter_ip,
+    SUM(CASE WHEN NOT is_starter_role THEN innings_pitched ELSE 0 END) AS bullpen_ip,
+    SUM(innings_pitched) AS total_ip,
+    SUM(quality_starts) AS total_qs,
+    SUM(CASE WHEN (COALESCE(games_started, 0) > 0) THEN games_started
+             WHEN is_starter_role THEN games
+             ELSE 0 END) AS total_gs,
+    ROUND(AVG(era)::numeric, 2) AS avg_era
+FROM player_season_pitching
+GROUP BY season, team_code;
+
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY에 필요한 유니크 인덱스
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_team_pitching_season
+    ON mv_team_pitching_season (season, team_code);
+
+-- 시즌 데이터 적재 후 갱신 (pg_cron 등으로 스케줄):
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY mv_team_pitching_season;
@@ -57,6 +57,15 @@ async def lifespan(app):
     load_clf()
     pool = get_connection_pool()  # 커넥션 풀 초기화
 
+    # 모더레이션용 Gemini REST 클라이언트 warmup (요청 경로에서 lazy 초기화 비용 제거)
+    try:
+        if get_settings().gemini_api_key:
+            from .routers import moderation
+
+            moderation.get_client()
+    except Exception as e:
+        print(f"[Warning] Failed to warm up moderation client: {e}")
+
     # [Coach Caching] 캐시 테이블 자동 생성 (편의성)
     try:
         with pool.connection() as conn:
@@ -84,6 +93,12 @@ async def lifespan(app):
     yield
 
     # 종료 시
+    try:
+        from .routers import moderation
+
+        await moderation.close_client()  # Gemini REST 클라이언트 정리
+    except Exception as e:
+        print(f"[Warning] Failed to close moderation client: {e}")
     close_connection_pool()  # 모든 커넥션 정리
 
 
@@ -1,14 +1,183 @@
 from fastapi import APIRouter, Body, HTTPException
-import google.generativeai as genai
-import json
+import asyncio
 import logging
-from typing import Dict, Any
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import orjson
 
 from ..config import get_settings
+from ..core.embeddings import async_embed_query
+from ..core.moderation_cache import moderation_cache
+from ..core.moderation_prefilter import prefilter
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/moderation", tags=["moderation"])
 
+# 모듈 전역 HTTP 클라이언트 - SDK의 동기 generate_content 대신 Gemini REST
+# 엔드포인트를 직접 호출합니다. 커넥션을 재사용하므로 이후 호출의 TCP/TLS
+# 핸드셰이크 비용이 사라지고, 이벤트 루프를 블로킹하지 않습니다.
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Gemini REST 호출용 AsyncClient를 lazy 초기화 후 재사용합니다."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = httpx.AsyncClient(
+                    base_url="https://generativelanguage.googleapis.com",
+                    timeout=10.0,
+                )
+    return _CLIENT
+
+
+async def close_client() -> None:
+    """lifespan 종료 시 전역 클라이언트를 닫습니다."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
+
+_BATCH_PROMPT_TEMPLATE = """
+당신은 KBO(한국 프로야구) 커뮤니티의 콘텐츠 관리자입니다.
+아래 항목 목록의 각 텍스트를 분석하여 카테고리를 분류하고 적절한 조치를 제안하세요.
+
+분류 카테고리:
+- SAFE: 정상적인 게시글 또는 댓글.
+- INAPPROPRIATE: 비속어, 욕설, 혐오 표현, 특정 팀이나 팬에 대한 과도한 비하.
+- SPAM: 상업적 광고, 무의미한 도배, 게시판 주제와 무관한 내용.
+- SPOILER: 실시간 경기 결과나 결정적 상황을 미리 유출하여 다른 팬의 즐거움을 해치는 내용.
+
+항목 목록 (JSON):
+{items}
+
+결과는 반드시 항목마다 하나씩, 아래 형식의 JSON 배열로만 응답하세요:
+[
+  {{
+    "id": <항목의 id 그대로>,
+    "category": "SAFE" | "INAPPROPRIATE" | "SPAM" | "SPOILER",
+    "reason": "한국어로 된 짧은 이유",
+    "action": "ALLOW" | "BLOCK"
+  }}
+]
+"""
+
+
+class ModerationBatcher:
+    """여러 모더레이션 요청을 하나의 Gemini 호출로 묶는 동적 배처(dynamic batcher)입니다.
+
+    요청이 들어오면 최대 `max_delay`초 동안 대기하며 최대 `max_batch_size`개의
+    항목을 모아 단일 프롬프트로 Gemini에 질의하고, id 기준으로 각 요청의
+    Future를 resolve합니다. 버스트 트래픽에서 호출당 RTT와 토큰 오버헤드를
+    여러 요청에 분산시킵니다.
+    """
+
+    def __init__(self, max_batch_size: int = 16, max_delay: float = 0.05) -> None:
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+    async def classify(self, content: str) -> Dict:
+        """본문 하나를 배치 큐에 넣고 판정 결과를 기다립니다.
+
+        배치 호출이 실패하면 항목별로 예외가 전파되며, 호출 측의
+        fail-open 처리에 그대로 맡깁니다.
+        """
+        await self._ensure_worker()
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((content, future))
+        return await future
+
+    async def _ensure_worker(self) -> None:
+        if self._worker is not None and not self._worker.done():
+            return
+        async with self._lock:
+            if self._worker is None or self._worker.done():
+                if self._queue is None:
+                    self._queue = asyncio.Queue()
+                self._worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # 첫 항목은 무기한 대기, 이후 max_delay 안에 도착한 항목을 합류시킴
+            batch: List[Tuple[str, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            await self._process(batch)
+
+    async def _process(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        items = [{"id": i, "text": content} for i, (content, _) in enumerate(batch)]
+        try:
+            settings = get_settings()
+            prompt = _BATCH_PROMPT_TEMPLATE.format(items=orjson.dumps(items).decode())
+            # API 키는 URL이 아니라 헤더로 전달 - httpx 예외 메시지에 전체
+            # URL이 포함되므로 쿼리 파라미터로 넣으면 로그/응답에 키가 노출됨
+            response = await get_client().post(
+                f"/v1beta/models/{settings.gemini_model}:generateContent",
+                headers={"x-goog-api-key": settings.gemini_api_key},
+                json={
+                    "contents": [{"parts": [{"text": prompt}]}],
+                    "generationConfig": {"response_mime_type": "application/json"},
+                },
+            )
+            response.raise_for_status()
+            body = orjson.loads(response.content)
+            text = body["candidates"][0]["content"]["parts"][0]["text"]
+            verdicts = orjson.loads(text)
+            by_id = {v.get("id"): v for v in verdicts if isinstance(v, dict)}
+            logger.info(
+                "[Moderation] Batched %d item(s) into one Gemini call", len(batch)
+            )
+            for i, (_, future) in enumerate(batch):
+                if future.done():
+                    continue
+                verdict = by_id.get(i)
+                if verdict is None:
+                    future.set_exception(
+                        ValueError(f"No verdict returned for batch item {i}")
+                    )
+                    continue
+                future.set_result(
+                    {
+                        "category": verdict.get("category", "SAFE"),
+                        "reason": verdict.get("reason", ""),
+                        "action": verdict.get("action", "ALLOW"),
+                    }
+                )
+        except Exception as e:
+            # 배치 전체가 실패해도 항목별로 예외를 전달하여 호출 측의
+            # fail-open 경로가 그대로 동작하도록 합니다.
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+# 모듈 전역 배처 - 엔드포인트에서 공유
+_batcher = ModerationBatcher()
+
+# 짧은 댓글이라도 이 문자가 있으면 trivial 처리하지 않음 (URL/멘션/태그 단서)
+_SUSPECT_CHARS = frozenset("/@:.#")
+
+# trivial SAFE 처리 횟수 - MODERATION_MIN_LENGTH 튜닝용 카운터
+_trivial_count = 0
+
 
 @router.post("/safety-check")
 async def safety_check(payload: Dict[str, Any] = Body(...)):
@@ -30,43 +199,69 @@ async def safety_check(payload: Dict[str, Any] = Body(...)):
             "action": "ALLOW",
         }
 
+    # 정규식 프리필터: LLM 없이 결정 가능한 케이스를 마이크로초 단위로 가림
+    verdict = prefilter(content, settings)
+    if verdict == "BLOCK":
+        logger.info("[Moderation] Prefilter BLOCK")
+        return {
+            "category": "INAPPROPRIATE",
+            "reason": "차단 목록 용어 포함",
+            "action": "BLOCK",
+        }
+
+    # 이모지 하나, "ㅋㅋㅋ" 같은 구조적으로 사소한 입력은 LLM 없이 허용.
+    # 프리필터가 SAFE로 본 경우에만 적용 - UNKNOWN(의심 패턴 일치)은 짧아도
+    # 캐시/LLM 경로로 넘김. 카운터로 MODERATION_MIN_LENGTH를 검수 결과와 대조해 튜닝.
+    stripped = content.strip()
+    if (
+        verdict == "SAFE"
+        and len(stripped) < settings.moderation_min_length
+        and stripped.isprintable()
+        and not (_SUSPECT_CHARS & set(stripped))
+    ):
+        global _trivial_count
+        _trivial_count += 1
+        logger.info("[Moderation] Trivial SAFE (count=%d)", _trivial_count)
+        return {"category": "SAFE", "reason": "trivial", "action": "ALLOW"}
+
+    if verdict == "SAFE" and len(content) < 200:
+        # 의심 패턴이 전혀 없는 짧은 댓글 - LLM 판정 없이 허용
+        return {"category": "SAFE", "reason": "prefilter", "action": "ALLOW"}
+
+    # 1차: 정확 일치 캐시 (정규화된 본문의 SHA256)
+    cached = await moderation_cache.get_exact(content)
+    if cached is not None:
+        logger.info("[Moderation] Exact cache HIT")
+        return cached
+
+    # 2차: 의미 기반 캐시 (임베딩 코사인 유사도). 임베딩 실패 시 캐시 없이 진행.
+    embedding = None
     try:
-        genai.configure(api_key=settings.gemini_api_key)
-        model = genai.GenerativeModel(settings.gemini_model)
-
-        prompt = f"""
-        당신은 KBO(한국 프로야구) 커뮤니티의 콘텐츠 관리자입니다.
-        다음 텍스트를 분석하여 카테고리를 분류하고 적절한 조치를 제안하세요.
-
-        분류 카테고리:
-        - SAFE: 정상적인 게시글 또는 댓글.
-        - INAPPROPRIATE: 비속어, 욕설, 혐오 표현, 특정 팀이나 팬에 대한 과도한 비하.
-        - SPAM: 상업적 광고, 무의미한 도배, 게시판 주제와 무관한 내용.
-        - SPOILER: 실시간 경기 결과나 결정적 상황을 미리 유출하여 다른 팬의 즐거움을 해치는 내용.
-
-        텍스트: "{content}"
-
-        결과는 반드시 아래의 JSON 형식으로만 응답하세요:
-        {{
-          "category": "SAFE" | "INAPPROPRIATE" | "SPAM" | "SPOILER",
-          "reason": "한국어로 된 짧은 이유",
-          "action": "ALLOW" | "BLOCK"
-        }}
-        """
+        embedding = await async_embed_query(content, settings)
+    except Exception as e:
+        logger.warning(f"[Moderation] Embedding for semantic cache failed: {e}")
 
-        response = model.generate_content(
-            prompt, generation_config={"response_mime_type": "application/json"}
-        )
+    if embedding:
+        cached = await moderation_cache.get_semantic(embedding)
+        if cached is not None:
+            logger.info("[Moderation] Semantic cache HIT")
+            return cached
 
-        result = json.loads(response.text)
+    try:
+        # 동시에 도착한 요청들은 배처가 하나의 Gemini 호출로 묶어 처리합니다.
+        result = await _batcher.classify(content)
         logger.info(f"Moderation result for content: {result}")
+
+        # 실제 판정만 캐시 (fail-open 응답은 캐시하지 않음)
+        await moderation_cache.set(content, result, embedding)
         return result
 
     except Exception as e:
         logger.error(f"Moderation error: {str(e)}")
         # 에러 발생 시 시스템 중단을 방지하기 위해 SAFE로 반환 (Fail-open 전략)
+        # 예외 원문은 로그에만 남김 - 응답에 실으면 내부 정보가 노출될 수 있음
         return {
             "category": "SAFE",
-            "reason": f"System error: {str(e)}",
+            "reason": "System error",
             "action": "ALLOW",
         }
@@ -0,0 +1,58 @@
+"""
+player_season_pitching에 is_starter_role 생성 컬럼과 부분 인덱스를 추가하는 스크립트입니다.
+
+선발 판정 술어 `(GS > 0 OR QS > 0 OR 경기당 3이닝 이상)`는 집계 쿼리의 CASE
+세 곳에서 행마다 반복 평가됩니다. STORED 생성 컬럼으로 한 번만 계산해 두면
+나눗셈이 핫 패스에서 빠지고, 선발/불펜 부분 인덱스가 각각의 분할 집계를
+따로 서빙할 수 있습니다.
+"""
+
+import os
+import psycopg
+from dotenv import load_dotenv
+
+load_dotenv("AI/.env")
+
+dsn = os.getenv("OCI_DB_URL")
+print(f"Connecting to database...")
+
+try:
+    conn = psycopg.connect(dsn, connect_timeout=30, autocommit=True)
+
+    with conn.cursor() as cur:
+        # 1. Generated column - 선발 판정 술어를 행 저장 시점에 한 번만 계산
+        print("Adding is_starter_role generated column...")
+        cur.execute("""
+            ALTER TABLE player_season_pitching
+            ADD COLUMN IF NOT EXISTS is_starter_role boolean
+            GENERATED ALWAYS AS (
+                (COALESCE(games_started, 0) > 0)
+                OR (COALESCE(quality_starts, 0) > 0)
+                OR ((innings_pitched / NULLIF(games, 0)) >= 3)
+            ) STORED
+        """)
+
+        # 2. 선발/불펜 분할 집계를 각각 서빙하는 부분 인덱스
+        print("Creating partial indexes...")
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_psp_starter
+            ON player_season_pitching (season, team_code)
+            WHERE is_starter_role
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_psp_bullpen
+            ON player_season_pitching (season, team_code)
+            WHERE NOT is_starter_role
+        """)
+
+        cur.execute("ANALYZE player_season_pitching")
+        print("ANALYZE complete.")
+
+    conn.close()
+    print("\nDatabase optimization complete!")
+
+except Exception as e:
+    print(f"Error: {e}")
+    import traceback
+
+    traceback.print_exc()
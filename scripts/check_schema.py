@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+주요 테이블의 스키마(컬럼 구성)를 빠르게 확인하는 스크립트.
+
+마이그레이션 전후로 컬럼 이름/타입이 기대와 일치하는지 확인할 때 사용합니다.
+app.deps의 공유 커넥션 풀을 사용하므로 반복 실행 시에도 TCP/TLS/인증
+핸드셰이크 비용을 다시 지불하지 않습니다.
+
+Usage:
+    python scripts/check_schema.py                      # 기본 테이블 전체
+    python scripts/check_schema.py coach_analysis_cache # 특정 테이블만
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.deps import get_connection_pool
+
+DEFAULT_TABLES = [
+    "coach_analysis_cache",
+    "rag_chunks",
+    "player_season_pitching",
+]
+
+
+def list_columns(table_name: str) -> list:
+    """information_schema에서 테이블의 컬럼 목록을 조회합니다."""
+    pool = get_connection_pool()
+    with pool.connection() as conn:
+        return conn.execute(
+            """
+            SELECT column_name, data_type, is_nullable
+            FROM information_schema.columns
+            WHERE table_name = %s
+            ORDER BY ordinal_position
+            """,
+            (table_name,),
+        ).fetchall()
+
+
+def main():
+    tables = sys.argv[1:] or DEFAULT_TABLES
+
+    for table in tables:
+        columns = list_columns(table)
+        print(f"\n=== {table} ({len(columns)} columns) ===")
+        if not columns:
+            print("  (테이블 없음 또는 컬럼 없음)")
+            continue
+        for name, data_type, is_nullable in columns:
+            nullable = "NULL" if is_nullable == "YES" else "NOT NULL"
+            print(f"  {name:<25} {data_type:<20} {nullable}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+player_season_pitching에 (season, team_code) 커버링 인덱스를 생성하는 스크립트입니다.
+
+verify_*.py와 코치 데이터 툴의 팀 투구 집계는 모두
+`WHERE season = %s [AND team_code = %s] GROUP BY team_code` 형태로,
+집계에 쓰는 컬럼을 INCLUDE로 실어두면 힙 접근 없는 IndexOnlyScan +
+GroupAggregate로 처리되어 읽는 바이트와 GROUP BY 전 정렬이 사라집니다.
+"""
+
+import os
+import time
+import psycopg
+from dotenv import load_dotenv
+
+load_dotenv("AI/.env")
+
+INDEX_NAME = "idx_psp_season_team_cover"
+
+dsn = os.getenv("OCI_DB_URL")
+print(f"Connecting to database...")
+
+try:
+    conn = psycopg.connect(dsn, connect_timeout=30, autocommit=True)
+
+    with conn.cursor() as cur:
+        # 1. Check if index already exists
+        cur.execute(
+            """
+            SELECT indexname FROM pg_indexes
+            WHERE tablename = 'player_season_pitching' AND indexname = %s
+            """,
+            (INDEX_NAME,),
+        )
+        existing = cur.fetchone()
+
+        if existing:
+            print(f"{INDEX_NAME} already exists. Skipping creation.")
+        else:
+            print("Creating covering index on (season, team_code)...")
+
+            start = time.time()
+            # CONCURRENTLY: 서비스 중 테이블 잠금 없이 생성 (autocommit 필요)
+            # is_starter_role(STORED 생성 컬럼)도 INCLUDE - verify/MV 집계가
+            # 이 컬럼을 참조하므로 빠지면 힙 접근이 생겨 IndexOnlyScan이 깨짐
+            cur.execute(f"""
+                CREATE INDEX CONCURRENTLY {INDEX_NAME}
+                ON player_season_pitching (season, team_code)
+                INCLUDE (games_started, quality_starts, innings_pitched, games, era,
+                         is_starter_role)
+            """)
+            elapsed = time.time() - start
+            print(f"Covering index created successfully in {elapsed:.2f}s")
+
+        # 2. Refresh planner statistics so the new index is considered
+        cur.execute("ANALYZE player_season_pitching")
+        print("ANALYZE complete.")
+
+        # 3. Verify the aggregation now uses an IndexOnlyScan
+        # verify_bullpen_fix.py가 실제로 실행하는 집계로 확인 (is_starter_role 포함)
+        cur.execute("""
+            EXPLAIN SELECT
+                SUM(CASE WHEN NOT is_starter_role THEN innings_pitched ELSE 0 END),
+                SUM(innings_pitched),
+                SUM(CASE WHEN NOT is_starter_role THEN games ELSE 0 END),
+                SUM(games)
+            FROM player_season_pitching
+            WHERE season = 2025 AND team_code = 'LG'
+            """)
+        plan = cur.fetchall()
+        print("Query plan:")
+        for row in plan:
+            print(f"  {row[0]}")
+
+    conn.close()
+    print("\nDatabase optimization complete!")
+
+except Exception as e:
+    print(f"Error: {e}")
+    import traceback
+
+    traceback.print_exc()
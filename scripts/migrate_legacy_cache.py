@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+레거시 Coach 분석 캐시(response_json)를 현행 스키마 값으로 정규화하는 스크립트.
+
+초기 프롬프트 버전은 status("양호"/"주의"/"위험")와 risk area("불펜"/"선발" 등)를
+한국어로 저장했습니다. 현행 렌더러/검증기는 영어 값(good/warning/danger,
+bullpen/starter/...)을 기대하므로, COMPLETED 상태의 캐시 행을 읽어
+값을 매핑 테이블로 치환한 뒤 변경된 행만 UPDATE합니다.
+
+Usage:
+    python scripts/migrate_legacy_cache.py
+    python scripts/migrate_legacy_cache.py --dry-run
+"""
+
+import argparse
+import logging
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import orjson
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.deps import get_connection_pool
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+# app/core/coach_validator.py의 정규화 규칙과 동일한 매핑
+STATUS_MAP = {
+    "양호": "good",
+    "positive": "good",
+    "최상": "good",
+    "주의": "warning",
+    "caution": "warning",
+    "보통": "warning",
+    "위험": "danger",
+    "critical": "danger",
+    "bad": "danger",
+}
+
+AREA_MAP = {
+    "불펜": "bullpen",
+    "릴리프": "bullpen",
+    "선발": "starter",
+    "starting": "starter",
+    "타격": "batting",
+    "타선": "batting",
+    "수비": "defense",
+    "전체": "overall",
+}
+
+
+def _apply(d: Dict, field: str, mapping: Dict[str, str]) -> bool:
+    """매핑 테이블을 한 번의 lookup으로 적용하고 변경 여부를 반환합니다.
+
+    `mapping.get(old, old)`는 미스 시 동일 객체를 반환하므로
+    `in` + `[]`의 이중 lookup 없이 identity 비교로 변경을 감지합니다.
+    """
+    old = d.get(field)
+    new = mapping.get(old, old)
+    if new is not old:
+        d[field] = new
+        return True
+    return False
+
+
+def normalize_response_json(data: Dict) -> Tuple[Dict, bool]:
+    """response_json 한 건을 현행 스키마 값으로 정규화합니다.
+
+    Returns:
+        (정규화된 dict, 변경 여부)
+    """
+    changed = False
+
+    for metric in data.get("key_metrics") or []:
+        if isinstance(metric, dict):
+            changed |= _apply(metric, "status", STATUS_MAP)
+
+    analysis = data.get("analysis") or {}
+
+    for risk in analysis.get("risks") or []:
+        if isinstance(risk, dict):
+            changed |= _apply(risk, "area", AREA_MAP)
+
+    # 레거시 데이터의 앞뒤 공백을 단일 comprehension으로 정리
+    for field in ("strengths", "weaknesses"):
+        items = analysis.get(field)
+        if isinstance(items, list):
+            stripped = [s.strip() if isinstance(s, str) else s for s in items]
+            if stripped != items:
+                analysis[field] = stripped
+                changed = True
+
+    return data, changed
+
+
+# 서버사이드 커서의 fetch 단위 / UPDATE 배치 크기
+ITERSIZE = 1000
+UPDATE_BATCH_SIZE = 500
+
+# 워커 프로세스당 map 호출 하나로 넘기는 행 수 (pickle 오버헤드 분산)
+MAP_CHUNKSIZE = 200
+
+
+def _norm(pair: Tuple[str, str]) -> Optional[Tuple[str, str]]:
+    """워커 프로세스에서 JSON 한 건을 파싱/정규화합니다.
+
+    입출력이 문자열뿐이라 pickle 비용이 작습니다. 변경이 없으면 None을
+    반환해 메인 프로세스의 UPDATE 버퍼에 들어가지 않도록 합니다.
+    """
+    cache_key, js = pair
+    normalized, changed = normalize_response_json(orjson.loads(js))
+    if not changed:
+        return None
+    return (orjson.dumps(normalized).decode(), cache_key)
+
+
+def _flush_updates(conn, updates: list, dry_run: bool) -> int:
+    """버퍼에 쌓인 (json_text, cache_key) 튜플을 한 트랜잭션으로 UPDATE합니다."""
+    if not updates:
+        return 0
+    if dry_run:
+        logger.info(f"[DRY-RUN] 변경 대상 {len(updates)}행 (UPDATE 생략)")
+        return len(updates)
+
+    with conn.transaction():
+        with conn.cursor() as cur:
+            cur.executemany(
+                """
+                UPDATE coach_analysis_cache
+                SET response_json = %s::jsonb, updated_at = now()
+                WHERE cache_key = %s
+                """,
+                updates,
+            )
+    logger.info(f"UPDATE 배치 커밋: {len(updates)}행")
+    return len(updates)
+
+
+def migrate_legacy_cache(dry_run: bool = False) -> dict:
+    """COMPLETED 상태의 캐시 행을 정규화하고 변경된 행만 UPDATE합니다.
+
+    response_json 전체를 fetchall()로 메모리에 올리는 대신 서버사이드(named)
+    커서로 스트리밍하여 메모리 사용을 O(itersize)로 제한하고, UPDATE는
+    행 단위가 아니라 UPDATE_BATCH_SIZE 단위로 모아 트랜잭션당 한 번만
+    커밋합니다. (읽기/쓰기 커넥션을 분리하여 named 커서를 유지한 채
+    배치 커밋이 가능하도록 함)
+
+    JSON 파싱 + dict 순회는 CPU 바운드라 단일 프로세스에서는 GIL에
+    직렬화됩니다. ITERSIZE 단위로 모은 행을 ProcessPoolExecutor로
+    병렬 정규화하고(문자열 입출력이라 pickle이 쌈), UPDATE는 기존대로
+    메인 프로세스의 쓰기 커넥션 하나로만 수행합니다.
+    """
+    pool = get_connection_pool()
+    scanned = 0
+    updated = 0
+    updates: list = []
+
+    def _drain(executor, rows: List[Tuple[str, str]]) -> int:
+        """행 묶음을 워커 풀로 정규화하고 변경분을 UPDATE 버퍼에 쌓습니다."""
+        nonlocal updated
+        for result in executor.map(_norm, rows, chunksize=MAP_CHUNKSIZE):
+            if result is None:
+                continue
+            updates.append(result)
+            if len(updates) >= UPDATE_BATCH_SIZE:
+                updated += _flush_updates(write_conn, updates, dry_run)
+                updates.clear()
+        return len(rows)
+
+    with pool.connection() as read_conn, pool.connection() as write_conn:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            with read_conn.transaction():
+                with read_conn.cursor(name="legacy_mig") as cur:
+                    cur.itersize = ITERSIZE
+                    cur.execute("""
+                        SELECT cache_key, response_json::text
+                        FROM coach_analysis_cache
+                        WHERE status = 'COMPLETED' AND response_json IS NOT NULL
+                        """)
+
+                    rows: List[Tuple[str, str]] = []
+                    for row in cur:
+                        rows.append(row)
+                        if len(rows) >= ITERSIZE:
+                            scanned += _drain(executor, rows)
+                            rows = []
+                    scanned += _drain(executor, rows)
+
+        # 잔여분 flush
+        updated += _flush_updates(write_conn, updates, dry_run)
+
+    logger.info(f"스캔: {scanned}행, 변경: {updated}행 (dry_run={dry_run})")
+    return {"scanned": scanned, "updated": updated, "dry_run": dry_run}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="레거시 Coach 캐시 정규화 스크립트")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="UPDATE 없이 변경 대상만 확인",
+    )
+    args = parser.parse_args()
+
+    result = migrate_legacy_cache(dry_run=args.dry_run)
+
+    print("\n결과:")
+    print(f"  스캔: {result['scanned']}행")
+    print(f"  {'변경 예정' if args.dry_run else '변경됨'}: {result['updated']}행")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Supabase(rag_chunks) → Firebase Firestore/Storage 마이그레이션 스크립트.
+
+rag_chunks 테이블의 청크를 Firestore 문서로 복사하고, 본문(content)은
+Firebase Storage에 업로드합니다. 마이그레이션된 행은 Supabase의 meta에
+migration 정보를 병합해 기록합니다. 진행 상태는 migration_progress.json에
+체크포인트로 저장되어 중단 후 재개할 수 있습니다.
+
+사용법:
+    python scripts/migrate_to_firebase.py --service-account-key path/to/key.json
+
+    # Dry run (실제 쓰기 없음)
+    python scripts/migrate_to_firebase.py --service-account-key key.json --dry-run
+
+    # Storage 업로드 생략 (Firestore에만 저장)
+    python scripts/migrate_to_firebase.py --service-account-key key.json --skip-storage
+"""
+
+import argparse
+import asyncio
+import gzip
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import orjson
+import psycopg
+
+import firebase_admin
+from firebase_admin import credentials, firestore_async, storage
+
+FIRESTORE_COLLECTION = "rag_chunks"
+
+# 청크 동시 처리 상한 - Firestore 쓰기/Storage 업로드/메타 버퍼링이
+# 이 수만큼 겹쳐서 진행됨 (RTT-직렬 → RTT-병렬)
+MAX_CONCURRENCY = 32
+
+# 체크포인트 저장 주기 (배치 단위) - 종료/예외 시에는 항상 저장됨
+CHECKPOINT_EVERY = 10
+
+
+class FirebaseMigration:
+    """rag_chunks를 Firestore/Storage로 옮기는 마이그레이션 작업 단위입니다."""
+
+    def __init__(
+        self,
+        service_account_key_path: str,
+        supabase_db_url: str,
+        batch_size: int = 100,
+        dry_run: bool = False,
+        skip_storage: bool = False,
+    ):
+        self.batch_size = batch_size
+        self.dry_run = dry_run
+        self.skip_storage = skip_storage
+
+        # 서비스 계정 키에서 프로젝트 ID를 읽어 Storage 버킷 이름을 구성
+        key_info = orjson.loads(Path(service_account_key_path).read_bytes())
+        cred = credentials.Certificate(service_account_key_path)
+        if not firebase_admin._apps:
+            firebase_admin.initialize_app(
+                cred,
+                {"storageBucket": f"{key_info['project_id']}.firebasestorage.app"},
+            )
+
+        # async Firestore 클라이언트 - 문서 쓰기를 await으로 겹쳐 실행
+        self.db_firestore = firestore_async.client()
+        self.bucket = None if skip_storage else storage.bucket()
+
+        # connect()에서 초기화되는 async 커넥션
+        self.supabase_db_url = supabase_db_url
+        self.pg_conn: Optional[psycopg.AsyncConnection] = None
+        # (meta_json, chunk_id) - 배치 경계에서 한 트랜잭션으로 flush
+        self._pending_meta: List[tuple] = []
+
+        self.progress_file = Path(__file__).parent / "migration_progress.json"
+        self.progress = self._load_progress()
+
+    async def connect(self) -> None:
+        """Supabase(PostgreSQL)에 async 커넥션을 엽니다."""
+        self.pg_conn = await psycopg.AsyncConnection.connect(self.supabase_db_url)
+
+    # ------------------------------------------------------------
+    # 진행 상태 (체크포인트)
+    # ------------------------------------------------------------
+
+    def _load_progress(self) -> Dict:
+        if self.progress_file.exists():
+            return orjson.loads(self.progress_file.read_bytes())
+        return {"last_id": 0, "migrated_count": 0, "failed_ids": []}
+
+    def _save_progress(self) -> None:
+        """체크포인트를 tmp 파일에 쓴 뒤 os.replace로 원자적으로 교체합니다.
+
+        쓰기 도중 크래시가 나도 기존 체크포인트가 깨지지 않아
+        재시작 시 마지막으로 저장된 위치에서 재개할 수 있습니다.
+        """
+        tmp = self.progress_file.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(self.progress, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, self.progress_file)
+
+    # ------------------------------------------------------------
+    # 데이터 읽기 / 쓰기
+    # ------------------------------------------------------------
+
+    # 모든 코드 경로가 사용하는 경량 컬럼 (content/embedding은 옵션)
+    _BASE_COLS = (
+        "id",
+        "season_year",
+        "season_id",
+        "league_type_code",
+        "team_id",
+        "player_id",
+        "source_table",
+        "source_row_id",
+        "title",
+        "meta",
+        "created_at",
+    )
+
+    async def fetch_batch(
+        self,
+        last_id: int,
+        *,
+        include_content: bool = True,
+        include_embedding: bool = True,
+    ) -> List[Dict]:
+        """id 기준 keyset 페이지네이션으로 다음 배치를 가져옵니다.
+
+        서버사이드(named) 커서로 읽어 배치가 서버에서 점진적으로 전송되게
+        하고, dict 행 팩토리의 행당 생성 비용 대신 고정 컬럼 튜플에
+        dict(zip(...))으로 직접 매핑합니다.
+
+        rag_chunks 행의 대역폭은 embedding(~3KB 벡터 리터럴)과 content
+        (수 KB 본문)가 지배하므로, 이를 사용하지 않는 경로(예: meta만
+        갱신하는 재개 실행)에서는 SELECT 목록에서 제외해 PG→클라이언트
+        전송량을 그만큼 줄입니다.
+        """
+        cols = list(self._BASE_COLS)
+        if include_content:
+            cols.append("content")
+        if include_embedding:
+            cols.append("embedding")
+
+        async with self.pg_conn.cursor(name=f"mig_{last_id}") as cur:
+            cur.itersize = self.batch_size
+            await cur.execute(
+                f"""
+                SELECT {', '.join(cols)}
+                FROM rag_chunks
+                WHERE id > %s
+                ORDER BY id
+                LIMIT %s
+                """,
+                (last_id, self.batch_size),
+            )
+            rows = await cur.fetchmany(self.batch_size)
+        return [dict(zip(cols, row)) for row in rows]
+
+    def _upload_content(self, chunk: Dict) -> Optional[Dict]:
+        """청크 본문을 gzip 압축해 Storage에 업로드합니다. (스레드 안전)
+
+        한국어/영어 혼합 텍스트는 gzip으로 3-5배가량 줄어들어 전송량이
+        그만큼 감소하고, content_encoding='gzip'을 지정하면 클라이언트는
+        투명하게 원문을 내려받습니다.
+
+        Returns:
+            {"path": ..., "contentLength": ..., "compressedLength": ...} 또는 None
+        """
+        content = chunk.get("content") or ""
+        if self.bucket is None or not content:
+            return None
+        storage_path = f"{FIRESTORE_COLLECTION}/{chunk['id']}.txt"
+        data = gzip.compress(content.encode("utf-8"))
+        if not self.dry_run:
+            blob = self.bucket.blob(storage_path)
+            blob.content_encoding = "gzip"
+            blob.content_type = "text/plain; charset=utf-8"
+            blob.upload_from_string(data, content_type=blob.content_type)
+        return {
+            "path": storage_path,
+            "contentLength": len(content),
+            "compressedLength": len(data),
+        }
+
+    async def migrate_chunk(self, chunk: Dict) -> bool:
+        """청크 하나를 Firestore(+Storage)에 기록하고 Supabase meta를 갱신합니다.
+
+        Storage 업로드(sync SDK)는 to_thread로, Firestore 쓰기는 async
+        클라이언트로 실행되어 세마포어 한도만큼 청크들이 동시에 진행됩니다.
+        """
+        chunk_id = chunk["id"]
+        try:
+            # pgvector 컬럼은 텍스트('[0.1,0.2,...]')로 내려오므로 float 배열로 변환.
+            # 1536차원 배열을 행마다 JSON 파서로 읽는 대신 numpy의 C 루프로 파싱
+            embedding = chunk.get("embedding")
+            if isinstance(embedding, str):
+                embedding = np.fromstring(
+                    embedding[1:-1], sep=",", dtype=np.float32
+                ).tolist()
+
+            content = chunk.get("content") or ""
+            # sync Storage SDK를 이벤트 루프 밖(워커 스레드)에서 실행
+            upload = await asyncio.to_thread(self._upload_content, chunk)
+            storage_path = upload["path"] if upload else None
+
+            firestore_data = {
+                "seasonYear": chunk.get("season_year"),
+                "seasonId": chunk.get("season_id"),
+                "leagueTypeCode": chunk.get("league_type_code"),
+                "teamId": chunk.get("team_id"),
+                "playerId": chunk.get("player_id"),
+                "sourceTable": chunk.get("source_table"),
+                "sourceRowId": chunk.get("source_row_id"),
+                "title": chunk.get("title"),
+                "content": content,
+                "embedding": embedding,
+                "meta": chunk.get("meta") or {},
+                "storagePath": storage_path,
+                "contentLength": len(content),
+                "compressedLength": upload["compressedLength"] if upload else None,
+                "createdAt": chunk.get("created_at"),
+            }
+
+            if not self.dry_run:
+                doc_ref = self.db_firestore.collection(FIRESTORE_COLLECTION).document(
+                    str(chunk_id)
+                )
+                await doc_ref.set(firestore_data)
+
+                # Supabase meta 갱신은 청크마다 커밋(= WAL fsync)하지 않고
+                # 배치 경계에서 한 트랜잭션으로 flush되도록 버퍼에만 쌓음
+                migration_meta = orjson.dumps(
+                    {
+                        "firebase_migrated": True,
+                        "firebase_storage_path": storage_path,
+                    }
+                ).decode()
+                self._pending_meta.append((migration_meta, chunk_id))
+
+            return True
+
+        except Exception as e:
+            print(f"  청크 {chunk_id} 실패: {e}")
+            return False
+
+    async def _flush_meta_updates(self) -> None:
+        """버퍼에 쌓인 Supabase meta 갱신을 한 트랜잭션으로 커밋합니다."""
+        if not self._pending_meta:
+            return
+        async with self.pg_conn.cursor() as cur:
+            await cur.executemany(
+                "UPDATE rag_chunks SET meta = meta || %s::jsonb WHERE id = %s",
+                self._pending_meta,
+            )
+        await self.pg_conn.commit()
+        self._pending_meta.clear()
+
+    # ------------------------------------------------------------
+    # 실행 루프
+    # ------------------------------------------------------------
+
+    async def run(self) -> None:
+        print(f"{'=' * 60}")
+        print("Firebase 마이그레이션 시작")
+        print(
+            f"  batch_size={self.batch_size}, dry_run={self.dry_run}, "
+            f"skip_storage={self.skip_storage}, 동시 실행={MAX_CONCURRENCY}"
+        )
+        print(f"  재개 위치: id > {self.progress['last_id']}")
+        print(f"{'=' * 60}\n")
+
+        if self.pg_conn is None:
+            await self.connect()
+
+        # SIGTERM을 SystemExit으로 바꿔 finally의 체크포인트 저장이 항상 실행되게 함
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+        start = time.time()
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        batches_since_checkpoint = 0
+
+        async def _guarded(chunk: Dict) -> tuple:
+            async with sem:
+                return chunk["id"], await self.migrate_chunk(chunk)
+
+        try:
+            while True:
+                batch = await self.fetch_batch(self.progress["last_id"])
+                if not batch:
+                    break
+
+                # 청크들은 서로 독립적이므로 세마포어 한도 내에서 동시에 처리
+                results = await asyncio.gather(*(_guarded(chunk) for chunk in batch))
+                for chunk_id, ok in results:
+                    if ok:
+                        self.progress["migrated_count"] += 1
+                    else:
+                        self.progress["failed_ids"].append(chunk_id)
+
+                # 배치 경계에서 meta 갱신을 flush
+                await self._flush_meta_updates()
+                self.progress["last_id"] = batch[-1]["id"]
+
+                # 체크포인트는 매 배치가 아니라 CHECKPOINT_EVERY 배치마다 저장
+                # (종료/예외 시에는 finally에서 저장됨)
+                batches_since_checkpoint += 1
+                if batches_since_checkpoint >= CHECKPOINT_EVERY:
+                    self._save_progress()
+                    batches_since_checkpoint = 0
+
+                elapsed = time.time() - start
+                rate = self.progress["migrated_count"] / elapsed if elapsed > 0 else 0
+                print(
+                    f"진행: {self.progress['migrated_count']}개 완료 "
+                    f"(last_id={self.progress['last_id']}, {rate:.1f}개/초)"
+                )
+        finally:
+            self._save_progress()
+
+        print(f"\n{'=' * 60}")
+        print("마이그레이션 완료!")
+        print(f"  성공: {self.progress['migrated_count']}개")
+        print(f"  실패: {len(self.progress['failed_ids'])}개")
+        print(f"{'=' * 60}")
+
+    async def close(self) -> None:
+        if self.pg_conn is not None:
+            await self._flush_meta_updates()
+            await self.pg_conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Supabase → Firebase 마이그레이션")
+    parser.add_argument(
+        "--service-account-key",
+        required=True,
+        help="Firebase 서비스 계정 키 JSON 파일 경로",
+    )
+    parser.add_argument(
+        "--supabase-url",
+        default=os.getenv("OCI_DB_URL"),
+        help="Supabase PostgreSQL 연결 URL (기본값: 환경변수 OCI_DB_URL)",
+    )
+    parser.add_argument("--batch-size", type=int, default=100, help="배치 크기")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Dry run 모드 (실제 데이터 변경 없음)"
+    )
+    parser.add_argument(
+        "--skip-storage",
+        action="store_true",
+        help="Firebase Storage 업로드 스킵 (Firestore에만 저장)",
+    )
+    args = parser.parse_args()
+
+    if not args.supabase_url:
+        print(
+            "오류: Supabase DB URL이 필요합니다. --supabase-url 또는 환경변수 OCI_DB_URL을 설정하세요."
+        )
+        sys.exit(1)
+
+    migration = FirebaseMigration(
+        service_account_key_path=args.service_account_key,
+        supabase_db_url=args.supabase_url,
+        batch_size=args.batch_size,
+        dry_run=args.dry_run,
+        skip_storage=args.skip_storage,
+    )
+
+    async def _run():
+        try:
+            await migration.connect()
+            await migration.run()
+        finally:
+            await migration.close()
+
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@
 import os
 import sys
 import json
+import asyncio
 import argparse
 from pathlib import Path
 from typing import List
@@ -19,7 +20,7 @@ from typing import List
 from migrate_to_firebase import FirebaseMigration
 
 
-def retry_failed_chunks(
+async def retry_failed_chunks(
     service_account_key_path: str,
     supabase_db_url: str,
     dry_run: bool = False,
@@ -61,6 +62,7 @@ def retry_failed_chunks(
         dry_run=dry_run,
         skip_storage=skip_storage,
     )
+    await migration.connect()
 
     # 실패한 청크들을 다시 시도
     success_count = 0
@@ -73,8 +75,8 @@ def retry_failed_chunks(
 
         # Supabase에서 청크 데이터 가져오기
         try:
-            with migration.pg_conn.cursor() as cur:
-                cur.execute(
+            async with migration.pg_conn.cursor() as cur:
+                await cur.execute(
                     """
                     SELECT
                         id, season_year, season_id, league_type_code,
@@ -86,7 +88,7 @@ def retry_failed_chunks(
                     (chunk_id,),
                 )
 
-                row = cur.fetchone()
+                row = await cur.fetchone()
 
                 if not row:
                     print("❌ 데이터 없음")
@@ -111,7 +113,7 @@ def retry_failed_chunks(
                 }
 
                 # 마이그레이션 시도
-                if migration.migrate_chunk(chunk):
+                if await migration.migrate_chunk(chunk):
                     print("✓ 성공")
                     success_count += 1
                 else:
@@ -151,7 +153,7 @@ def retry_failed_chunks(
             print(f"✓ 모든 청크가 성공적으로 마이그레이션되었습니다!")
             print(f"진행 파일을 삭제해도 됩니다: rm {progress_file}")
 
-    migration.close()
+    await migration.close()
 
 
 def main():
@@ -183,11 +185,13 @@ def main():
         )
         sys.exit(1)
 
-    retry_failed_chunks(
-        service_account_key_path=args.service_account_key,
-        supabase_db_url=args.supabase_url,
-        dry_run=args.dry_run,
-        skip_storage=args.skip_storage,
+    asyncio.run(
+        retry_failed_chunks(
+            service_account_key_path=args.service_account_key,
+            supabase_db_url=args.supabase_url,
+            dry_run=args.dry_run,
+            skip_storage=args.skip_storage,
+        )
     )
 
 
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Firestore 벡터 검색을 수동으로 확인하는 스크립트.
+
+migrate_to_firebase.py로 옮긴 rag_chunks 컬렉션에 대해 기본 검색,
+필터 검색, 소스 테이블별 비교 검색을 순서대로 실행해 결과를 출력합니다.
+
+쿼리 임베딩은 main() 시작 시 한 번의 배치 호출로 모두 생성해 재사용합니다.
+검사마다 embed_texts를 따로 호출하면 임베딩 API RTT(100-500ms)를
+검사 수만큼 반복 지불하게 되는데, 배치 호출은 총 토큰 수에 비례하는
+비용을 한 번의 RTT로 끝냅니다.
+
+사용법:
+    python scripts/test_firestore_search.py --service-account-key path/to/key.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import firebase_admin
+from firebase_admin import credentials, firestore
+from google.cloud.firestore_v1.base_vector_query import DistanceMeasure
+from google.cloud.firestore_v1.vector import Vector
+
+from app.config import Settings
+from app.core.embeddings import embed_texts
+
+# 모든 검사가 사용하는 쿼리 - 임베딩은 main()에서 한 번에 배치 생성
+QUERIES = [
+    "2024년 KIA 타이거즈 성적",
+    "홈런왕",
+    "타율 1위",
+]
+
+
+def similarity_search_firestore(db, query_embedding, limit=5, source_table=None):
+    """Firestore rag_chunks 컬렉션에서 코사인 기준 최근접 문서를 조회합니다."""
+    query = db.collection("rag_chunks")
+    if source_table:
+        query = query.where("sourceTable", "==", source_table)
+
+    snapshots = query.find_nearest(
+        vector_field="embedding",
+        query_vector=Vector(query_embedding),
+        distance_measure=DistanceMeasure.COSINE,
+        limit=limit,
+    ).get()
+    return [doc.to_dict() for doc in snapshots]
+
+
+def test_basic_search(db, embeddings):
+    query = QUERIES[0]
+    print(f"\n=== 기본 검색: {query} ===")
+    for i, doc in enumerate(similarity_search_firestore(db, embeddings[query])):
+        print(f"[{i+1}] {doc.get('sourceTable')} | {doc.get('title')}")
+
+
+def test_filtered_search(db, embeddings):
+    query = QUERIES[1]
+    print(f"\n=== 필터 검색 (player_season_batting): {query} ===")
+    docs = similarity_search_firestore(
+        db, embeddings[query], source_table="player_season_batting"
+    )
+    for i, doc in enumerate(docs):
+        print(f"[{i+1}] {doc.get('title')} | season={doc.get('seasonYear')}")
+
+
+def test_comparison(db, embeddings):
+    query = QUERIES[2]
+    print(f"\n=== 소스 테이블별 비교: {query} ===")
+    for source_table in (None, "player_season_batting"):
+        docs = similarity_search_firestore(
+            db, embeddings[query], limit=3, source_table=source_table
+        )
+        label = source_table or "전체"
+        titles = [doc.get("title") for doc in docs]
+        print(f"  [{label}] {titles}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Firestore 벡터 검색 확인")
+    parser.add_argument(
+        "--service-account-key",
+        required=True,
+        help="Firebase 서비스 계정 키 JSON 파일 경로",
+    )
+    args = parser.parse_args()
+
+    if not firebase_admin._apps:
+        firebase_admin.initialize_app(credentials.Certificate(args.service_account_key))
+    db = firestore.client()
+
+    # 모든 쿼리를 한 번의 배치 호출로 임베딩 (검사당 RTT → 전체 1 RTT)
+    embeddings = dict(zip(QUERIES, embed_texts(QUERIES, Settings())))
+
+    test_basic_search(db, embeddings)
+    test_filtered_search(db, embeddings)
+    test_comparison(db, embeddings)
+
+
+if __name__ == "__main__":
+    main()
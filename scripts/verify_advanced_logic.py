@@ -0,0 +1,75 @@
+"""
+고급 투수 지표(불펜 과부하 순위) 검증 스크립트.
+
+app/tools/database_query.py의 팀 투구 지표 쿼리와 같은 집계를 독립 실행해
+결과를 출력합니다. 선수 단위 집계는 mv_team_pitching_season
+머티리얼라이즈드 뷰(app/db/create_team_pitching_mv.sql)에 미리 계산되어
+있으므로, 여기서는 과부하 상위 5팀과 대상 팀 행만 읽어 출력합니다.
+
+Usage:
+    python scripts/verify_advanced_logic.py [season] [team_code]
+"""
+
+import sys
+from functools import lru_cache
+
+from verify_common import fmt1, stream_query
+
+# 대상 팀(기본 LG) 행과 과부하 상위 5팀만 서버에서 필터해 가져옴
+# 출력에 쓰는 컬럼만 투영 - total_ip/total_qs/total_gs는 파생 지표 계산에만
+# 쓰이므로 밖으로 내보내지 않아 정렬/전송 튜플 폭을 줄임
+ADVANCED_PITCHING_SQL = """
+    SELECT *
+    FROM (
+        SELECT
+            team_code, starter_ip, bullpen_ip, avg_era,
+            (bullpen_ip / NULLIF(total_ip, 0) * 100)::float8 AS bullpen_share,
+            (total_qs::float8 / NULLIF(total_gs, 0) * 100)::float8 AS qs_rate,
+            ROW_NUMBER() OVER (ORDER BY bullpen_ip / NULLIF(total_ip, 0) DESC) AS load_rank
+        FROM mv_team_pitching_season
+        WHERE season = %s::int
+    ) ranked
+    WHERE team_code = %s OR load_rank <= 5
+    ORDER BY load_rank;
+"""
+
+
+@lru_cache(maxsize=32)
+def team_rollup(season: int, team_code: str) -> tuple:
+    """시즌 팀 롤업을 조회하고 프로세스 내에서 캐시합니다.
+
+    같은 프로세스에서 여러 시즌/검증을 반복 실행할 때(REPL, 스윕)
+    warm 호출은 DB 왕복 없이 캐시된 결과를 재사용합니다.
+    """
+    return tuple(stream_query(ADVANCED_PITCHING_SQL, (season, team_code)))
+
+
+def verify_advanced_logic(season: int, team_code: str):
+    print(f"=== {season} 시즌 팀 투구 고급 지표 검증 (대상: {team_code}) ===\n")
+
+    rows = list(team_rollup(season, team_code))
+
+    if not rows:
+        print("데이터가 없습니다.")
+        return
+
+    # 행당 print 대신 버퍼에 모아 한 번의 write로 출력
+    lines = [
+        f"{'팀':<4} {'선발IP':>8} {'불펜IP':>8} {'불펜비중':>8} "
+        f"{'QS율':>6} {'ERA':>6} {'과부하순위':>9}"
+    ]
+    for row in rows:
+        team = row["team_code"]
+        marker = " ◀" if team == team_code else ""
+        lines.append(
+            f"{team:<4} {row['starter_ip']:>8} {row['bullpen_ip']:>8} "
+            f"{fmt1(row['bullpen_share']):>7}% {fmt1(row['qs_rate']):>5}% "
+            f"{row['avg_era']:>6} {row['load_rank']:>8}위{marker}"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    season = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+    team_code = sys.argv[2] if len(sys.argv) > 2 else "LG"
+    verify_advanced_logic(season, team_code)
@@ -0,0 +1,50 @@
+"""
+불펜 비중(bullpen_share) 계산 수정 검증 스크립트.
+
+과거 버그는 불펜 비중을 등판 경기 수 기준(불펜 등판 수 / 전체 등판 수)으로
+계산해 짧게 자주 나오는 불펜의 비중이 과대평가되었습니다. 수정판은 소화
+이닝 기준(불펜 이닝 / 전체 이닝)으로 계산합니다. 두 값을 같은 시즌/팀
+슬라이스 한 번의 스캔으로 함께 계산해 비교합니다.
+
+Usage:
+    python scripts/verify_bullpen_fix.py [season] [team_code]
+"""
+
+import sys
+
+from verify_common import fmt1, run_query
+
+# 경기 수 기준(버그)과 이닝 기준(수정)의 불펜 비중을 한 번의 스캔으로 계산
+# 선발 판정은 is_starter_role 생성 컬럼 사용 (scripts/add_starter_role_column.py)
+BULLPEN_COMPARE_SQL = """
+    SELECT
+        SUM(CASE WHEN NOT is_starter_role THEN innings_pitched ELSE 0 END) AS bullpen_ip,
+        SUM(innings_pitched) AS total_ip,
+        (100.0 * SUM(CASE WHEN NOT is_starter_role THEN games ELSE 0 END)
+         / NULLIF(SUM(games), 0))::float8 AS bad_share,
+        (100.0 * SUM(CASE WHEN NOT is_starter_role THEN innings_pitched ELSE 0 END)
+         / NULLIF(SUM(innings_pitched), 0))::float8 AS fixed_share
+    FROM player_season_pitching
+    WHERE season = %s AND team_code = %s;
+"""
+
+
+def verify_bullpen_logic(season: int, team_code: str):
+    print(f"=== {season} 시즌 {team_code} 불펜 비중 계산 검증 ===\n")
+
+    rows = run_query(BULLPEN_COMPARE_SQL, (season, team_code))
+    row = rows[0] if rows else None
+
+    if not row or row["total_ip"] is None:
+        print("데이터가 없습니다.")
+        return
+
+    print(f"불펜 이닝 / 전체 이닝:  {row['bullpen_ip']} / {row['total_ip']}")
+    print(f"버그 비중 (경기 수 기준): {fmt1(row['bad_share'])}%")
+    print(f"수정 비중 (이닝 기준):   {fmt1(row['fixed_share'])}%")
+
+
+if __name__ == "__main__":
+    season = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
+    team_code = sys.argv[2] if len(sys.argv) > 2 else "LG"
+    verify_bullpen_logic(season, team_code)
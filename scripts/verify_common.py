@@ -0,0 +1,54 @@
+"""
+verify_*.py 스크립트 공용 쿼리 러너.
+
+세 검증 스크립트가 각자 들고 있던 커넥션/커서/실행 보일러플레이트를
+한 곳으로 모으고, 행을 위치 인덱스(row[7] 등) 대신 컬럼명으로 접근할 수
+있도록 dict 행(row_factory=dict_row)으로 반환합니다. 커넥션은 app.deps의
+공유 풀에서 빌립니다.
+"""
+
+import sys
+import os
+from typing import Dict, Iterator, List, Sequence
+
+# Add parent directory to path to import app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from psycopg.rows import dict_row
+
+from app.deps import get_connection_pool
+
+
+def fmt1(value) -> str:
+    """표시용 소수 1자리 포맷. NULL(None)은 '-'로 표기합니다."""
+    return f"{value:.1f}" if value is not None else "-"
+
+
+def run_query(sql: str, params: Sequence = ()) -> List[Dict]:
+    """공유 풀에서 커넥션을 빌려 쿼리를 실행하고 dict 행 목록을 반환합니다.
+
+    prepare=True로 서버사이드 prepared statement를 사용해, 같은 커넥션에서
+    같은 쿼리를 반복 실행할 때 파싱/플래닝을 건너뜁니다.
+    """
+    pool = get_connection_pool()
+    with pool.connection() as conn:
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(sql, params, prepare=True)
+            return cur.fetchall()
+
+
+def stream_query(
+    sql: str, params: Sequence = (), itersize: int = 1000
+) -> Iterator[Dict]:
+    """서버사이드(named) 커서로 dict 행을 스트리밍합니다.
+
+    풀 커넥션은 autocommit이므로 named 커서를 명시적 트랜잭션 안에서
+    유지합니다. 클라이언트 메모리는 O(itersize)로 제한됩니다.
+    """
+    pool = get_connection_pool()
+    with pool.connection() as conn:
+        with conn.transaction():
+            with conn.cursor(name="verify_stream", row_factory=dict_row) as cur:
+                cur.itersize = itersize
+                cur.execute(sql, params, prepare=True)
+                yield from cur
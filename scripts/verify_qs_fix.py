@@ -0,0 +1,109 @@
+"""
+QS율(퀄리티스타트 비율) 분모 수정 검증 스크립트.
+
+과거 버그는 QS율 분모로 팀 전체 출장 경기 수(불펜 포함)를 사용해 QS율이
+실제보다 낮게 나왔습니다. 수정판은 선발 요건을 충족하는 선수의
+선발 등판 수만 분모로 셉니다. 버그 분모와 수정 분모를 별도 쿼리 두 번으로
+계산하는 대신, 같은 시즌/팀 슬라이스를 한 번만 스캔하는 단일 조건부 집계
+쿼리로 두 값을 함께 계산합니다.
+
+Usage:
+    python scripts/verify_qs_fix.py [season] [team_code]
+"""
+
+import sys
+
+from verify_common import fmt1, run_query
+
+# 버그 분모(전체 경기)와 수정 분모(선발 등판)를 한 번의 스캔으로 계산
+# 선발 판정은 is_starter_role 생성 컬럼 사용 (scripts/add_starter_role_column.py)
+QS_COMPARE_SQL = """
+    SELECT
+        SUM(quality_starts) AS total_qs,
+        SUM(games) AS bad_denom,
+        SUM(CASE WHEN (COALESCE(games_started, 0) > 0) THEN games_started
+                 WHEN is_starter_role THEN games
+                 ELSE 0 END) AS fixed_denom,
+        (100.0 * SUM(quality_starts) / NULLIF(SUM(games), 0))::float8 AS bad_qs_rate,
+        (100.0 * SUM(quality_starts)
+         / NULLIF(SUM(CASE WHEN (COALESCE(games_started, 0) > 0) THEN games_started
+                           WHEN is_starter_role THEN games
+                           ELSE 0 END), 0))::float8 AS fixed_qs_rate
+    FROM player_season_pitching
+    WHERE season = %s AND team_code = %s;
+"""
+
+
+# 여러 (season, team_code) 조합을 단일 쿼리로 스윕 - VALUES 목록은 실행 시 조립
+QS_COMPARE_MANY_SQL = """
+    SELECT
+        season,
+        team_code,
+        SUM(quality_starts) AS total_qs,
+        (100.0 * SUM(quality_starts) / NULLIF(SUM(games), 0))::float8 AS bad_qs_rate,
+        (100.0 * SUM(quality_starts)
+         / NULLIF(SUM(CASE WHEN (COALESCE(games_started, 0) > 0) THEN games_started
+                           WHEN is_starter_role THEN games
+                           ELSE 0 END), 0))::float8 AS fixed_qs_rate
+    FROM player_season_pitching
+    WHERE (season, team_code) IN ({values})
+    GROUP BY season, team_code
+    ORDER BY season, team_code;
+"""
+
+
+def verify_qs_many(seasons, team_codes):
+    """여러 시즌/팀 조합을 반복 쿼리 대신 한 번의 왕복으로 검증합니다."""
+    pairs = [(season, team) for season in seasons for team in team_codes]
+    sql = QS_COMPARE_MANY_SQL.format(values=", ".join(["(%s, %s)"] * len(pairs)))
+    params = [value for pair in pairs for value in pair]
+
+    print(f"=== QS율 분모 일괄 검증 ({len(pairs)}개 조합) ===\n")
+
+    rows = run_query(sql, params)
+
+    if not rows:
+        print("데이터가 없습니다.")
+        return
+
+    # 행당 print 대신 버퍼에 모아 한 번의 write로 출력
+    lines = [f"{'시즌':<6} {'팀':<4} {'QS':>4} {'버그 QS율':>9} {'수정 QS율':>9}"]
+    lines.extend(
+        f"{row['season']:<6} {row['team_code']:<4} {row['total_qs']:>4} "
+        f"{fmt1(row['bad_qs_rate']):>8}% {fmt1(row['fixed_qs_rate']):>8}%"
+        for row in rows
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def verify_qs_logic(season: int, team_code: str):
+    print(f"=== {season} 시즌 {team_code} QS율 분모 검증 ===\n")
+
+    rows = run_query(QS_COMPARE_SQL, (season, team_code))
+    row = rows[0] if rows else None
+
+    if not row or row["total_qs"] is None:
+        print("데이터가 없습니다.")
+        return
+
+    print(f"QS 합계:          {row['total_qs']}")
+    print(
+        f"버그 분모 (전체 경기): {row['bad_denom']} → QS율 {fmt1(row['bad_qs_rate'])}%"
+    )
+    print(
+        f"수정 분모 (선발 등판): {row['fixed_denom']} → QS율 {fmt1(row['fixed_qs_rate'])}%"
+    )
+
+
+if __name__ == "__main__":
+    # 쉼표 구분으로 여러 시즌/팀을 주면 단일 쿼리 일괄 검증으로 전환
+    # 예: python scripts/verify_qs_fix.py 2024,2025 LG,KIA
+    seasons = [
+        int(s) for s in (sys.argv[1] if len(sys.argv) > 1 else "2025").split(",")
+    ]
+    team_codes = (sys.argv[2] if len(sys.argv) > 2 else "LG").split(",")
+
+    if len(seasons) == 1 and len(team_codes) == 1:
+        verify_qs_logic(seasons[0], team_codes[0])
+    else:
+        verify_qs_many(seasons, team_codes)
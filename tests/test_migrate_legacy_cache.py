@@ -0,0 +1,64 @@
+import json
+
+from scripts.migrate_legacy_cache import _norm, normalize_response_json
+
+
+class TestNormalizeResponseJson:
+    def test_legacy_korean_values_are_mapped(self):
+        """한국어 status/area 값이 현행 영어 값으로 치환되어야 함"""
+        data = {
+            "key_metrics": [
+                {"label": "불펜 소화 이닝", "value": "512.1", "status": "위험"},
+                {"label": "팀 ERA", "value": "4.21", "status": "good"},
+            ],
+            "analysis": {
+                "strengths": ["  타선 화력 "],
+                "weaknesses": ["선발 불안"],
+                "risks": [{"area": "불펜", "level": 0, "description": "과부하"}],
+            },
+        }
+
+        normalized, changed = normalize_response_json(data)
+
+        assert changed is True
+        assert normalized["key_metrics"][0]["status"] == "danger"
+        assert normalized["key_metrics"][1]["status"] == "good"
+        assert normalized["analysis"]["risks"][0]["area"] == "bullpen"
+        assert normalized["analysis"]["strengths"] == ["타선 화력"]
+
+    def test_already_normalized_rows_report_no_change(self):
+        """현행 값만 있는 행은 changed=False로 UPDATE 대상에서 제외되어야 함"""
+        data = {
+            "key_metrics": [{"label": "팀 ERA", "value": "4.21", "status": "warning"}],
+            "analysis": {
+                "strengths": ["수비 안정"],
+                "weaknesses": [],
+                "risks": [{"area": "starter", "level": 1, "description": "로테이션"}],
+            },
+        }
+
+        _, changed = normalize_response_json(data)
+        assert changed is False
+
+    def test_missing_sections_are_tolerated(self):
+        """key_metrics/analysis가 없는 레거시 행도 안전하게 처리되어야 함"""
+        _, changed = normalize_response_json({"headline": "요약만 있는 행"})
+        assert changed is False
+
+
+class TestNormWorker:
+    def test_changed_row_returns_update_tuple(self):
+        """변경된 행은 (json_text, cache_key) 순서의 UPDATE 파라미터를 반환"""
+        js = json.dumps({"key_metrics": [{"status": "양호"}]}, ensure_ascii=False)
+
+        result = _norm(("key-1", js))
+
+        assert result is not None
+        new_js, cache_key = result
+        assert cache_key == "key-1"
+        assert json.loads(new_js)["key_metrics"][0]["status"] == "good"
+
+    def test_unchanged_row_returns_none(self):
+        """변경 없는 행은 None으로 UPDATE 버퍼에서 제외"""
+        js = json.dumps({"key_metrics": [{"status": "good"}]})
+        assert _norm(("key-2", js)) is None
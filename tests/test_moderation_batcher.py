@@ -0,0 +1,89 @@
+import asyncio
+import json
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+from app.routers.moderation import ModerationBatcher
+
+
+def _mock_client(verdicts):
+    """지정한 판정 배열을 반환하는 가짜 Gemini REST 클라이언트를 만듭니다."""
+    body = {
+        "candidates": [
+            {"content": {"parts": [{"text": json.dumps(verdicts, ensure_ascii=False)}]}}
+        ]
+    }
+    response = MagicMock()
+    response.content = json.dumps(body, ensure_ascii=False).encode()
+    response.raise_for_status = MagicMock()
+    client = MagicMock()
+    client.post = AsyncMock(return_value=response)
+    return client
+
+
+@contextmanager
+def _patched(client):
+    settings = MagicMock(gemini_api_key="test-key", gemini_model="gemini-test")
+    with patch("app.routers.moderation.get_client", return_value=client), patch(
+        "app.routers.moderation.get_settings", return_value=settings
+    ):
+        yield
+
+
+class TestModerationBatcher:
+    def test_concurrent_requests_coalesced_into_one_call(self):
+        """max_delay 안에 도착한 요청들은 한 번의 Gemini 호출로 묶여야 함"""
+        verdicts = [
+            {"id": 0, "category": "SAFE", "reason": "정상", "action": "ALLOW"},
+            {"id": 1, "category": "SPAM", "reason": "광고", "action": "BLOCK"},
+            {"id": 2, "category": "SAFE", "reason": "정상", "action": "ALLOW"},
+        ]
+        client = _mock_client(verdicts)
+
+        async def scenario():
+            batcher = ModerationBatcher(max_batch_size=16, max_delay=0.05)
+            with _patched(client):
+                return await asyncio.gather(
+                    batcher.classify("댓글 하나"),
+                    batcher.classify("불법 광고"),
+                    batcher.classify("댓글 셋"),
+                )
+
+        results = asyncio.run(scenario())
+
+        assert client.post.await_count == 1
+        assert results[0]["category"] == "SAFE"
+        assert results[1] == {"category": "SPAM", "reason": "광고", "action": "BLOCK"}
+        assert results[2]["action"] == "ALLOW"
+
+    def test_batch_failure_propagates_per_item(self):
+        """배치 호출 실패 시 항목별로 예외가 전파되어 fail-open 처리에 맡겨져야 함"""
+        client = MagicMock()
+        client.post = AsyncMock(side_effect=RuntimeError("boom"))
+
+        async def scenario():
+            batcher = ModerationBatcher(max_batch_size=4, max_delay=0.01)
+            with _patched(client):
+                try:
+                    await batcher.classify("아무 댓글")
+                except RuntimeError as e:
+                    return str(e)
+            return None
+
+        assert asyncio.run(scenario()) == "boom"
+
+    def test_missing_verdict_id_raises(self):
+        """응답 배열에 id가 누락된 항목은 예외로 처리되어야 함"""
+        client = _mock_client([])  # 빈 배열 - 어떤 id도 없음
+
+        async def scenario():
+            batcher = ModerationBatcher(max_batch_size=4, max_delay=0.01)
+            with _patched(client):
+                try:
+                    await batcher.classify("아무 댓글")
+                except ValueError:
+                    return "missing"
+            return None
+
+        assert asyncio.run(scenario()) == "missing"
@@ -0,0 +1,75 @@
+import asyncio
+
+from app.core.moderation_cache import ModerationVerdictCache, _content_key
+
+SAFE_VERDICT = {"category": "SAFE", "reason": "정상 댓글", "action": "ALLOW"}
+BLOCK_VERDICT = {"category": "SPAM", "reason": "도배성 광고", "action": "BLOCK"}
+
+
+class TestModerationCache:
+    def test_exact_hit_after_set(self):
+        """같은 본문이면 공백/대소문자가 달라도 정확 일치 캐시에 적중해야 함"""
+
+        async def scenario():
+            cache = ModerationVerdictCache()
+            await cache.set("LG 우승 가자!!", SAFE_VERDICT)
+            hit = await cache.get_exact("  lg 우승  가자!! ")
+            miss = await cache.get_exact("전혀 다른 댓글")
+            return hit, miss
+
+        hit, miss = asyncio.run(scenario())
+        assert hit == SAFE_VERDICT
+        assert miss is None
+
+    def test_exact_key_normalization(self):
+        """캐시 키는 정규화된 본문 기준이어야 함"""
+        assert _content_key("Spam  Content") == _content_key("spam content")
+        assert _content_key("a") != _content_key("b")
+
+    def test_block_verdict_expires_earlier(self):
+        """BLOCK 판정은 짧은 TTL이 적용되어 만료 후 miss여야 함"""
+
+        async def scenario():
+            cache = ModerationVerdictCache(block_ttl=0.0, safe_ttl=3600)
+            await cache.set("불법 도박 사이트 홍보", BLOCK_VERDICT)
+            await cache.set("평범한 응원 댓글", SAFE_VERDICT)
+            expired = await cache.get_exact("불법 도박 사이트 홍보")
+            alive = await cache.get_exact("평범한 응원 댓글")
+            return expired, alive
+
+        expired, alive = asyncio.run(scenario())
+        assert expired is None
+        assert alive == SAFE_VERDICT
+
+    def test_semantic_hit_above_threshold(self):
+        """코사인 유사도가 임계값 이상인 경우에만 의미 기반 캐시에 적중해야 함"""
+
+        async def scenario():
+            cache = ModerationVerdictCache(semantic_threshold=0.95)
+            await cache.set("같은 의미의 댓글", SAFE_VERDICT, embedding=[1.0, 0.0, 0.0])
+            near = await cache.get_semantic([0.999, 0.01, 0.0])
+            far = await cache.get_semantic([0.0, 1.0, 0.0])
+            return near, far
+
+        near, far = asyncio.run(scenario())
+        assert near == SAFE_VERDICT
+        assert far is None
+
+    def test_exact_lru_eviction(self):
+        """max_entries를 초과하면 가장 오래된 항목부터 제거되어야 함"""
+
+        async def scenario():
+            cache = ModerationVerdictCache(max_entries=2)
+            await cache.set("댓글1", SAFE_VERDICT)
+            await cache.set("댓글2", SAFE_VERDICT)
+            await cache.set("댓글3", SAFE_VERDICT)
+            return (
+                await cache.get_exact("댓글1"),
+                await cache.get_exact("댓글2"),
+                await cache.get_exact("댓글3"),
+            )
+
+        first, second, third = asyncio.run(scenario())
+        assert first is None
+        assert second == SAFE_VERDICT
+        assert third == SAFE_VERDICT
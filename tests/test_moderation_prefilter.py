@@ -0,0 +1,24 @@
+from unittest.mock import MagicMock
+
+from app.core.moderation_prefilter import prefilter
+
+
+def _settings(blocklist=()):
+    return MagicMock(moderation_blocklist=list(blocklist))
+
+
+class TestModerationPrefilter:
+    def test_plain_comment_is_safe(self):
+        """아무 패턴에도 걸리지 않는 평범한 댓글은 SAFE"""
+        assert prefilter("오늘 경기 재밌었다", _settings()) == "SAFE"
+
+    def test_blocklist_term_blocks(self):
+        """설정 차단 목록의 용어가 있으면 대소문자 무관 BLOCK"""
+        settings = _settings(["금지어"])
+        assert prefilter("이 댓글은 금지어 포함", settings) == "BLOCK"
+        assert prefilter("평범한 댓글", settings) == "SAFE"
+
+    def test_suspect_pattern_defers_to_llm(self):
+        """URL/도박 의심 패턴은 UNKNOWN으로 LLM 판정에 넘김"""
+        assert prefilter("https://spam.example 무료 픽", _settings()) == "UNKNOWN"
+        assert prefilter("토토 사이트 추천", _settings()) == "UNKNOWN"